@@ -2,3 +2,6 @@ from __future__ import annotations
 
 TEXT_INPUT = "text input"
 POSITIVE_INPUT = "positive input"
+
+# The estimator doesn't keep a reference to the features it is given, which can thus be reused
+READ_ONLY_INPUT = "read-only input"
@@ -2,6 +2,8 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 
+from . import tags
+
 
 class Wrapper(ABC):
     """A wrapper model."""
@@ -20,7 +22,9 @@ class Wrapper(ABC):
         return f"{type(self).__name__}({self._wrapped_model})"
 
     def _more_tags(self):
-        return self._wrapped_model._tags
+        # A wrapper may keep the features it passes to the wrapped model, so it can't be assumed to
+        # treat them as read-only just because the wrapped model does
+        return self._wrapped_model._tags - {tags.READ_ONLY_INPUT}
 
     @property
     def _supervised(self):
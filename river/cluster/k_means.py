@@ -104,6 +104,9 @@ class KMeans(base.Clusterer):
     def _mutable_attributes(self):
         return {"halflife"}
 
+    def _more_tags(self):
+        return {base.tags.READ_ONLY_INPUT}
+
     def learn_predict_one(self, x):
         """Equivalent to `k_means.learn_one(x).predict_one(x)`, but faster."""
 
@@ -1,8 +1,11 @@
 from __future__ import annotations
 
 import copy
+import operator
+import pickle
 import typing
 
+import joblib
 import numpy as np
 
 try:
@@ -14,7 +17,7 @@ except ImportError:
 from sklearn import base as sklearn_base
 from sklearn import pipeline, preprocessing, utils
 
-from river import base, compose, stream
+from river import base, cluster, compose, linear_model
 
 __all__ = [
     "convert_river_to_sklearn",
@@ -25,11 +28,84 @@ __all__ = [
 ]
 
 
+def _iter_rows(rows: typing.Iterable, names: typing.Sequence, y, reuse: bool) -> base.typing.Stream:
+    """Pairs each row of values with the feature names.
+
+    A new dictionary is yielded for each row, because some estimators keep a reference to the
+    features they learn from. Estimators tagged with `tags.READ_ONLY_INPUT` don't, which is when
+    `reuse` can be set so that a single dictionary is updated in place for every row.
+
+    """
+    if not reuse:
+        for i, xi in enumerate(rows):
+            yield dict(zip(names, xi)), (None if y is None else y[i])
+        return
+
+    x = dict.fromkeys(names)
+    for i, xi in enumerate(rows):
+        x.update(zip(names, xi))
+        yield x, (None if y is None else y[i])
+
+
+def _iter_array(
+    X: np.ndarray, y: np.ndarray | None = None, reuse: bool = False
+) -> base.typing.Stream:
+    """Iterates over the rows of a validated 2D array.
+
+    This is a lean version of `stream.iter_array`. The feature names are only built once, and each
+    row is converted to native Python numbers in a single call, which is much cheaper than creating
+    a numpy scalar for each value.
+
+    """
+    return _iter_rows((xi.tolist() for xi in X), range(X.shape[1]), y, reuse)
+
+
+def _iter_array_x(X: np.ndarray, reuse: bool = False) -> typing.Iterator[dict]:
+    """Iterates over the features of each row of a validated 2D array.
+
+    This is `_iter_array` for the methods that have no use for the target, which saves a tuple per
+    row.
+
+    """
+    names = range(X.shape[1])
+    if not reuse:
+        for xi in X:
+            yield dict(zip(names, xi.tolist()))
+        return
+
+    x = dict.fromkeys(names)
+    for xi in X:
+        x.update(zip(names, xi.tolist()))
+        yield x
+
+
+def _iter_pandas(
+    X: pd.DataFrame, y: pd.Series | np.ndarray | None = None, reuse: bool = False
+) -> base.typing.Stream:
+    """Iterates over the rows of a dataframe.
+
+    This is a lean version of `stream.iter_pandas`. A numeric dataframe is converted to an array in
+    one go, and its rows are then handled like in `_iter_array`. Other dataframes are read with
+    `itertuples`, which yields native Python values without building a `pandas.Series` per row.
+
+    """
+    names = tuple(X.columns)
+    if isinstance(y, pd.Series):
+        y = y.to_numpy()
+
+    if all(pd.api.types.is_numeric_dtype(dtype) for dtype in X.dtypes):
+        rows = (xi.tolist() for xi in X.to_numpy())
+    else:
+        rows = X.itertuples(index=False, name=None)
+
+    return _iter_rows(rows, names, y, reuse)
+
+
 # Define a streaming method for each kind of batch input
-STREAM_METHODS: dict[type, typing.Callable] = {np.ndarray: stream.iter_array}
+STREAM_METHODS: dict[type, typing.Callable] = {np.ndarray: _iter_array}
 
 if PANDAS_INSTALLED:
-    STREAM_METHODS[pd.DataFrame] = stream.iter_pandas
+    STREAM_METHODS[pd.DataFrame] = _iter_pandas
 
 # Params passed to sklearn.utils.check_X_y and sklearn.utils.check_array
 SKLEARN_INPUT_X_PARAMS = {
@@ -48,6 +124,68 @@ SKLEARN_INPUT_X_PARAMS = {
 # Params passed to sklearn.utils.check_X_y in addition to SKLEARN_INPUT_X_PARAMS
 SKLEARN_INPUT_Y_PARAMS = {"multi_output": False, "y_numeric": False}
 
+# Below this number of rows, splitting the predictions between several threads isn't worth it
+PARALLEL_MIN_ROWS = 1024
+
+
+def _map_chunks(func: typing.Callable, X: np.ndarray, n_jobs: int | None) -> np.ndarray:
+    """Applies a function to contiguous chunks of rows and concatenates the outputs.
+
+    The chunks are processed by a pool of threads. This is safe for most river estimators, because
+    they don't modify their state when they make predictions. It isn't for estimators that are
+    lazily initialized when they predict, such as `cluster.KMeans`, which have to be given a single
+    job.
+
+    """
+    n_threads = joblib.effective_n_jobs(n_jobs)
+    if n_threads == 1 or len(X) < PARALLEL_MIN_ROWS:
+        return func(X)
+
+    bounds = np.linspace(0, len(X), n_threads + 1, dtype=int)
+    outputs = joblib.Parallel(n_jobs=n_threads, prefer="threads")(
+        joblib.delayed(func)(X[lo:hi]) for lo, hi in zip(bounds[:-1], bounds[1:])
+    )
+    return np.concatenate(outputs)
+
+
+def _fast_clone(estimator: base.Estimator) -> base.Estimator:
+    """Returns a deep copy of an estimator, state included.
+
+    A pickle round trip is done in C and is usually much faster than `copy.deepcopy`, which is
+    only used for estimators that can't be pickled. `base.Estimator.clone` can't be used here,
+    because it creates a fresh estimator and thus drops the learned state.
+
+    """
+    try:
+        return pickle.loads(pickle.dumps(estimator, protocol=pickle.HIGHEST_PROTOCOL))
+    except (pickle.PicklingError, TypeError, AttributeError):
+        return copy.deepcopy(estimator)
+
+
+def _k_means_centers(k_means: cluster.KMeans, n_features: int) -> np.ndarray | None:
+    """Returns the centers of a k-means model as an array with one row per cluster.
+
+    The centers are lazily initialized, they are thus filled in the same order as the first call
+    to `predict_one` would do. `None` is returned if the centers have features that aren't columns
+    of the array, in which case the distances can't be computed on the array alone.
+
+    """
+    features = range(n_features)
+    for center in k_means.centers.values():
+        for i in {*center.keys(), *features}:
+            center[i]
+    if any(len(center) != n_features for center in k_means.centers.values()):
+        return None
+    return np.array([[center[i] for i in features] for center in k_means.centers.values()])
+
+
+def _k_means_distances(X: np.ndarray, centers: np.ndarray, p: float) -> np.ndarray:
+    """Minkowski distances, raised to the power p, between each row and each center."""
+    distances = np.empty((len(X), len(centers)))
+    for j, center in enumerate(centers):
+        np.sum(np.abs(X - center) ** p, axis=1, out=distances[:, j])
+    return distances
+
 
 def convert_river_to_sklearn(estimator: base.Estimator):
     """Wraps a river estimator to make it compatible with scikit-learn.
@@ -73,7 +211,7 @@ def convert_river_to_sklearn(estimator: base.Estimator):
     for base_type, wrapper in wrappers:
         if isinstance(estimator, base_type):
             obj = wrapper(estimator)
-            obj.instance_ = copy.deepcopy(estimator)
+            obj.instance_ = _fast_clone(estimator)
             return obj
 
     raise ValueError("Couldn't find an appropriate wrapper")
@@ -86,6 +224,35 @@ class River2SKLBase(base.Wrapper, sklearn_base.BaseEstimator):
     def _wrapped_model(self):
         return self.river_estimator
 
+    def _get_tags(self):
+        # scikit-learn merges the _more_tags of every class in the MRO, but the one inherited from
+        # base.Wrapper returns the river tags of the wrapped estimator, which are a set of strings
+        # rather than scikit-learn tags
+        tags = {}
+        for base_class in reversed(type(self).__mro__):
+            if base_class is not base.Wrapper and "_more_tags" in vars(base_class):
+                tags.update(base_class._more_tags(self))
+        return tags
+
+    @property
+    def _reuse_input(self) -> bool:
+        """Whether a single dictionary can be used for all the rows the estimator learns from."""
+        return base.tags.READ_ONLY_INPUT in self.instance_._tags
+
+    def _check_predict_X(self, X) -> np.ndarray:
+        """Checks the inputs passed to a prediction method.
+
+        The finiteness check is skipped if validate is False. The array is made C-contiguous in the
+        same pass, so that iterating over its rows reads contiguous memory.
+
+        """
+        X = utils.check_array(
+            X, **{**SKLEARN_INPUT_X_PARAMS, "order": "C", "force_all_finite": self.validate}
+        )
+        if X.shape[1] != self.n_features_in_:
+            raise ValueError(f"Expected {self.n_features_in_} features, got {X.shape[1]}")
+        return X
+
     _required_parameters = ["river_estimator"]
 
 
@@ -95,15 +262,27 @@ class River2SKLRegressor(River2SKLBase, sklearn_base.RegressorMixin):
     Parameters
     ----------
     river_estimator
+    validate
+        Whether to check that the inputs passed to the prediction methods are finite. Setting this
+        to `False` saves a full pass over the data, which is what scikit-learn's `assume_finite`
+        configuration does.
+    n_jobs
+        Number of threads used to make predictions, `None` means 1 and -1 means using all the
+        processors. The rows are split into contiguous chunks, which is only worth it for large
+        inputs and estimators that release the GIL.
 
     """
 
-    def __init__(self, river_estimator: base.Regressor):
+    def __init__(
+        self, river_estimator: base.Regressor, validate: bool = True, n_jobs: int | None = 1
+    ):
         # Check the estimator is a Regressor
         if not isinstance(river_estimator, base.Regressor):
             raise ValueError("river_estimator is not a Regressor")
 
         self.river_estimator = river_estimator
+        self.validate = validate
+        self.n_jobs = n_jobs
 
     def _partial_fit(self, X, y):
         # Check the inputs
@@ -117,10 +296,10 @@ class River2SKLRegressor(River2SKLBase, sklearn_base.RegressorMixin):
         # scikit-learn's convention is that fit shouldn't mutate the input parameters; we have to
         # deep copy the provided estimator in order to respect this convention
         if not hasattr(self, "instance_"):
-            self.instance_ = copy.deepcopy(self.river_estimator)
+            self.instance_ = _fast_clone(self.river_estimator)
 
         # Call learn_one for each observation
-        for x, yi in STREAM_METHODS[type(X)](X, y):
+        for x, yi in STREAM_METHODS[type(X)](X, y, reuse=self._reuse_input):
             self.instance_.learn_one(x, yi)
 
         return self
@@ -185,17 +364,21 @@ class River2SKLRegressor(River2SKLBase, sklearn_base.RegressorMixin):
         utils.validation.check_is_fitted(self, attributes="instance_")
 
         # Check the input
-        X = utils.check_array(X, **SKLEARN_INPUT_X_PARAMS)
+        X = self._check_predict_X(X)
 
-        if X.shape[1] != self.n_features_in_:
-            raise ValueError(f"Expected {self.n_features_in_} features, got {X.shape[1]}")
+        # Linear models can make all the predictions in one vectorized call, which avoids having to
+        # build a dictionary for each observation
+        if PANDAS_INSTALLED and isinstance(self.instance_, linear_model.LinearRegression):
+            return self.instance_.predict_many(pd.DataFrame(X)).to_numpy(dtype=float)
 
         # Make a prediction for each observation
-        y_pred = np.empty(shape=len(X))
-        for i, (x, _) in enumerate(stream.iter_array(X)):
-            y_pred[i] = self.instance_.predict_one(x)
+        def predict_rows(X):
+            y_pred = np.empty(shape=len(X))
+            for i, x in enumerate(_iter_array_x(X, reuse=self._reuse_input)):
+                y_pred[i] = self.instance_.predict_one(x)
+            return y_pred
 
-        return y_pred
+        return _map_chunks(predict_rows, X, self.n_jobs)
 
 
 class River2SKLClassifier(River2SKLBase, sklearn_base.ClassifierMixin):
@@ -204,15 +387,27 @@ class River2SKLClassifier(River2SKLBase, sklearn_base.ClassifierMixin):
     Parameters
     ----------
     river_estimator
+    validate
+        Whether to check that the inputs passed to the prediction methods are finite. Setting this
+        to `False` saves a full pass over the data, which is what scikit-learn's `assume_finite`
+        configuration does.
+    n_jobs
+        Number of threads used to make predictions, `None` means 1 and -1 means using all the
+        processors. The rows are split into contiguous chunks, which is only worth it for large
+        inputs and estimators that release the GIL.
 
     """
 
-    def __init__(self, river_estimator: base.Classifier):
+    def __init__(
+        self, river_estimator: base.Classifier, validate: bool = True, n_jobs: int | None = 1
+    ):
         # Check the estimator is Classifier
         if not isinstance(river_estimator, base.Classifier):
             raise ValueError("estimator is not a Classifier")
 
         self.river_estimator = river_estimator
+        self.validate = validate
+        self.n_jobs = n_jobs
 
     def _more_tags(self):
         return {"binary_only": not self.river_estimator._multiclass}
@@ -250,7 +445,7 @@ class River2SKLClassifier(River2SKLBase, sklearn_base.ClassifierMixin):
         # scikit-learn's convention is that fit shouldn't mutate the input parameters; we have to
         # deep copy the provided estimator in order to respect this convention
         if not hasattr(self, "instance_"):
-            self.instance_ = copy.deepcopy(self.river_estimator)
+            self.instance_ = _fast_clone(self.river_estimator)
 
         # river's binary classifiers expects bools or 0/1 values
         if not self.river_estimator._multiclass:
@@ -259,7 +454,7 @@ class River2SKLClassifier(River2SKLBase, sklearn_base.ClassifierMixin):
             y = self.label_encoder_.transform(y)
 
         # Call learn_one for each observation
-        for x, yi in STREAM_METHODS[type(X)](X, y):
+        for x, yi in STREAM_METHODS[type(X)](X, y, reuse=self._reuse_input):
             self.instance_.learn_one(x, yi)
 
         return self
@@ -329,21 +524,31 @@ class River2SKLClassifier(River2SKLBase, sklearn_base.ClassifierMixin):
         utils.validation.check_is_fitted(self, attributes="instance_")
 
         # Check the input
-        X = utils.check_array(X, **SKLEARN_INPUT_X_PARAMS)
+        X = self._check_predict_X(X)
 
-        if X.shape[1] != self.n_features_in_:
-            raise ValueError(f"Expected {self.n_features_in_} features, got {X.shape[1]}")
+        # river's predictions have to converted to follow the scikit-learn conventions: each class
+        # is mapped to a column, and the classes that are missing have a probability of 0
+        class_to_col = {c: j for j, c in enumerate(self.classes_)}
 
-        # river's predictions have to converted to follow the scikit-learn conventions
-        def reshape_probas(y_pred):
-            return [y_pred.get(c, 0) for c in self.classes_]
+        # Linear models can make all the predictions in one vectorized call
+        if PANDAS_INSTALLED and isinstance(self.instance_, linear_model.LogisticRegression):
+            y_pred = np.zeros(shape=(len(X), len(self.classes_)))
+            y_proba = self.instance_.predict_proba_many(pd.DataFrame(X))
+            for c in y_proba.columns:
+                if (j := class_to_col.get(c)) is not None:
+                    y_pred[:, j] = y_proba[c].to_numpy(dtype=float)
+            return y_pred
 
         # Make a prediction for each observation
-        y_pred = np.empty(shape=(len(X), len(self.classes_)))
-        for i, (x, _) in enumerate(stream.iter_array(X)):
-            y_pred[i] = reshape_probas(self.instance_.predict_proba_one(x))
+        def predict_proba_rows(X):
+            y_pred = np.zeros(shape=(len(X), len(self.classes_)))
+            for i, x in enumerate(_iter_array_x(X, reuse=self._reuse_input)):
+                for c, p in self.instance_.predict_proba_one(x).items():
+                    if (j := class_to_col.get(c)) is not None:
+                        y_pred[i, j] = p
+            return y_pred
 
-        return y_pred
+        return _map_chunks(predict_proba_rows, X, self.n_jobs)
 
     def predict(self, X):
         """Predicts the target of an entire dataset contained in memory.
@@ -363,20 +568,41 @@ class River2SKLClassifier(River2SKLBase, sklearn_base.ClassifierMixin):
         utils.validation.check_is_fitted(self, attributes="instance_")
 
         # Check the input
-        X = utils.check_array(X, **SKLEARN_INPUT_X_PARAMS)
-
-        if X.shape[1] != self.n_features_in_:
-            raise ValueError(f"Expected {self.n_features_in_} features, got {X.shape[1]}")
+        X = self._check_predict_X(X)
+
+        # The predictions are encoded as integers if an encoder was necessary for binary
+        # classification, else they're the labels themselves. Other labels than numbers are stored
+        # as objects, because a fixed-width string dtype would truncate the longer ones
+        has_encoder = hasattr(self, "label_encoder_")
+        if has_encoder:
+            dtype = np.dtype(int)
+        else:
+            dtype = np.asarray(self.classes_).dtype
+            if dtype.kind not in "biuf":
+                dtype = np.dtype(object)
 
         # Make a prediction for each observation
-        y_pred = [None] * len(X)
-        for i, (x, _) in enumerate(stream.iter_array(X)):
-            y_pred[i] = self.instance_.predict_one(x)
+        def predict_rows(X):
+            y_pred = np.empty(len(X), dtype=dtype)
+            for i, x in enumerate(_iter_array_x(X, reuse=self._reuse_input)):
+                y_pred[i] = self.instance_.predict_one(x)
+            return y_pred
+
+        # Logistic regression can make all the predictions in one vectorized call. The most likely
+        # label is picked like in predict_one, which settles ties in favor of False
+        if (
+            PANDAS_INSTALLED
+            and has_encoder
+            and isinstance(self.instance_, linear_model.LogisticRegression)
+        ):
+            y_proba = self.instance_.predict_proba_many(pd.DataFrame(X))
+            y_pred = (y_proba[True] > y_proba[False]).to_numpy(dtype=int)
+        else:
+            y_pred = _map_chunks(predict_rows, X, self.n_jobs)
 
-        # Convert back to the expected labels if an encoder was necessary for binary classification
-        y_pred = np.asarray(y_pred)
-        if hasattr(self, "label_encoder_"):
-            y_pred = self.label_encoder_.inverse_transform(y_pred.astype(int))
+        # Convert back to the expected labels
+        if has_encoder:
+            y_pred = self.label_encoder_.inverse_transform(y_pred)
 
         return y_pred
 
@@ -387,15 +613,27 @@ class River2SKLTransformer(River2SKLBase, sklearn_base.TransformerMixin):
     Parameters
     ----------
     river_estimator
+    validate
+        Whether to check that the inputs passed to the prediction methods are finite. Setting this
+        to `False` saves a full pass over the data, which is what scikit-learn's `assume_finite`
+        configuration does.
+    n_jobs
+        Number of threads used to make predictions, `None` means 1 and -1 means using all the
+        processors. The rows are split into contiguous chunks, which is only worth it for large
+        inputs and estimators that release the GIL.
 
     """
 
-    def __init__(self, river_estimator: base.Transformer):
+    def __init__(
+        self, river_estimator: base.Transformer, validate: bool = True, n_jobs: int | None = 1
+    ):
         # Check the estimator is a Transformer
         if not isinstance(river_estimator, base.Transformer):
             raise ValueError("estimator is not a Transformer")
 
         self.river_estimator = river_estimator
+        self.validate = validate
+        self.n_jobs = n_jobs
 
     def _partial_fit(self, X, y):
         # Check the inputs
@@ -412,14 +650,14 @@ class River2SKLTransformer(River2SKLBase, sklearn_base.TransformerMixin):
         # scikit-learn's convention is that fit shouldn't mutate the input parameters; we have to
         # deep copy the provided estimator in order to respect this convention
         if not hasattr(self, "instance_"):
-            self.instance_ = copy.deepcopy(self.river_estimator)
+            self.instance_ = _fast_clone(self.river_estimator)
 
         # Call learn_one for each observation
         if isinstance(self.instance_, base.SupervisedTransformer):
-            for x, yi in STREAM_METHODS[type(X)](X, y):
+            for x, yi in STREAM_METHODS[type(X)](X, y, reuse=self._reuse_input):
                 self.instance_.learn_one(x, yi)
         else:
-            for x, _ in STREAM_METHODS[type(X)](X):
+            for x in _iter_array_x(X, reuse=self._reuse_input):
                 self.instance_.learn_one(x)
 
         return self
@@ -484,17 +722,30 @@ class River2SKLTransformer(River2SKLBase, sklearn_base.TransformerMixin):
         utils.validation.check_is_fitted(self, attributes="instance_")
 
         # Check the input
-        X = utils.check_array(X, **SKLEARN_INPUT_X_PARAMS)
-
-        if X.shape[1] != self.n_features_in_:
-            raise ValueError(f"Expected {self.n_features_in_} features, got {X.shape[1]}")
-
-        # Call predict_proba_one for each observation
-        X_trans = [None] * len(X)
-        for i, (x, _) in enumerate(STREAM_METHODS[type(X)](X)):
-            X_trans[i] = list(self.instance_.transform_one(x).values())
-
-        return np.asarray(X_trans)
+        X = self._check_predict_X(X)
+
+        # The output features are read in the order in which the first observation's transformation
+        # lists them, and that order is shared by every chunk of rows
+        features = list(self.instance_.transform_one(dict(enumerate(X[0].tolist()))))
+        get_values = operator.itemgetter(*features) if features else None
+
+        # Call transform_one for each observation
+        def transform_rows(X):
+            X_trans = np.empty((len(X), len(features)))
+            for i, x in enumerate(_iter_array_x(X, reuse=self._reuse_input)):
+                x_trans = self.instance_.transform_one(x)
+                if len(x_trans) == len(features):
+                    if get_values is None:
+                        continue
+                    try:
+                        X_trans[i] = get_values(x_trans)
+                        continue
+                    except KeyError:
+                        pass
+                raise ValueError(f"Expected the output features {features}, got {list(x_trans)}")
+            return X_trans
+
+        return _map_chunks(transform_rows, X, self.n_jobs)
 
 
 class River2SKLClusterer(River2SKLBase, sklearn_base.ClusterMixin):
@@ -503,15 +754,27 @@ class River2SKLClusterer(River2SKLBase, sklearn_base.ClusterMixin):
     Parameters
     ----------
     river_estimator
+    validate
+        Whether to check that the inputs passed to the prediction methods are finite. Setting this
+        to `False` saves a full pass over the data, which is what scikit-learn's `assume_finite`
+        configuration does.
+    n_jobs
+        Number of threads used to make predictions, `None` means 1 and -1 means using all the
+        processors. The rows are split into contiguous chunks, which is only worth it for large
+        inputs and estimators that release the GIL.
 
     """
 
-    def __init__(self, river_estimator: base.Clusterer):
+    def __init__(
+        self, river_estimator: base.Clusterer, validate: bool = True, n_jobs: int | None = 1
+    ):
         # Check the estimator is a Clusterer
         if not isinstance(river_estimator, base.Clusterer):
             raise ValueError("estimator is not a Clusterer")
 
         self.river_estimator = river_estimator
+        self.validate = validate
+        self.n_jobs = n_jobs
 
     def _partial_fit(self, X, y):
         # Check the inputs
@@ -525,11 +788,32 @@ class River2SKLClusterer(River2SKLBase, sklearn_base.ClusterMixin):
         # scikit-learn's convention is that fit shouldn't mutate the input parameters; we have to
         # deep copy the provided estimator in order to respect this convention
         if not hasattr(self, "instance_"):
-            self.instance_ = copy.deepcopy(self.river_estimator)
+            self.instance_ = _fast_clone(self.river_estimator)
 
-        # Call learn_one for each observation
         self.labels_ = np.empty(len(X), dtype=np.int32)
-        for i, (x, _) in enumerate(STREAM_METHODS[type(X)](X)):
+
+        # k-means is updated on the array directly, the centers are written back at the end
+        if (
+            isinstance(self.instance_, cluster.KMeans)
+            and len(X)
+            and (centers := _k_means_centers(self.instance_, X.shape[1])) is not None
+        ):
+            halflife, p = self.instance_.halflife, self.instance_.p
+            labels = list(self.instance_.centers)
+            for i, xi in enumerate(X):
+                distances = np.sum(np.abs(centers - xi) ** p, axis=1)
+                closest = distances.argmin()
+                centers[closest] += halflife * (xi - centers[closest])
+                # Moving a center scales its distance to the observation by |1 - halflife| ** p,
+                # the label is the one predict_one would return after learn_one
+                distances[closest] *= abs(1 - halflife) ** p
+                self.labels_[i] = labels[distances.argmin()]
+            for center, values in zip(self.instance_.centers.values(), centers):
+                center.update(zip(range(X.shape[1]), values.tolist()))
+            return self
+
+        # Call learn_one for each observation
+        for i, x in enumerate(_iter_array_x(X, reuse=self._reuse_input)):
             self.instance_.learn_one(x)
             label = self.instance_.predict_one(x)
             self.labels_[i] = label
@@ -596,11 +880,25 @@ class River2SKLClusterer(River2SKLBase, sklearn_base.ClusterMixin):
         utils.validation.check_is_fitted(self, attributes="instance_")
 
         # Check the input
-        X = utils.check_array(X, **SKLEARN_INPUT_X_PARAMS)
-
-        # Call predict_proba_one for each observation
-        y_pred = np.empty(len(X), dtype=np.int32)
-        for i, (x, _) in enumerate(STREAM_METHODS[type(X)](X)):
-            y_pred[i] = self.instance_.predict_one(x)
-
-        return y_pred
+        X = self._check_predict_X(X)
+
+        # The distances to the k-means centers are computed for all the observations at once
+        if (
+            isinstance(self.instance_, cluster.KMeans)
+            and len(X)
+            and (centers := _k_means_centers(self.instance_, X.shape[1])) is not None
+        ):
+            labels = np.array(list(self.instance_.centers), dtype=np.int32)
+            return labels[_k_means_distances(X, centers, self.instance_.p).argmin(axis=1)]
+
+        # Call predict_one for each observation
+        def predict_rows(X):
+            y_pred = np.empty(len(X), dtype=np.int32)
+            for i, x in enumerate(_iter_array_x(X, reuse=self._reuse_input)):
+                y_pred[i] = self.instance_.predict_one(x)
+            return y_pred
+
+        # k-means fills in its centers from a shared random number generator when it predicts, so
+        # it has to run in a single thread for the labels to be deterministic
+        n_jobs = 1 if isinstance(self.instance_, cluster.KMeans) else self.n_jobs
+        return _map_chunks(predict_rows, X, n_jobs)
@@ -1,12 +1,26 @@
 from __future__ import annotations
 
+import pickle
+
 import pandas as pd
 import pytest
 from sklearn import datasets as sk_datasets
 from sklearn import linear_model as sk_linear_model
 from sklearn.utils import estimator_checks
 
-from river import base, cluster, compat, linear_model, preprocessing
+from river import (
+    base,
+    cluster,
+    compat,
+    compose,
+    imblearn,
+    linear_model,
+    optim,
+    preprocessing,
+    stream,
+    tree,
+)
+from river.compat import river_to_sklearn
 
 
 @pytest.mark.parametrize(
@@ -85,3 +99,223 @@ def test_not_fitted_still_works_classification(estimator, n_classes):
 
     y_pred_proba = estimator.predict_proba_many(X)
     assert y_pred_proba.shape == (len(X), n_classes)
+
+
+def test_k_means_clusterer_matches_learn_one():
+    X, _ = sk_datasets.make_blobs(n_samples=300, n_features=3, centers=4, random_state=42)
+    skl_estimator = compat.convert_river_to_sklearn(cluster.KMeans(n_clusters=4, seed=42))
+    skl_estimator.fit(X[:200]).partial_fit(X[200:], None)
+
+    k_means = cluster.KMeans(n_clusters=4, seed=42)
+    labels = []
+    for x in X:
+        x = dict(enumerate(x))
+        k_means.learn_one(x)
+        labels.append(k_means.predict_one(x))
+
+    assert skl_estimator.labels_.tolist() == labels[200:]
+    assert skl_estimator.predict(X).tolist() == [k_means.predict_one(dict(enumerate(x))) for x in X]
+    for center, expected in zip(skl_estimator.instance_.centers.values(), k_means.centers.values()):
+        assert center == pytest.approx(expected)
+
+
+@pytest.mark.parametrize(
+    "estimator",
+    [
+        pytest.param(estimator, id=str(estimator))
+        for estimator in [linear_model.LinearRegression(), preprocessing.StandardScaler()]
+    ],
+)
+def test_read_only_input_reuses_dict(estimator):
+    assert base.tags.READ_ONLY_INPUT in estimator._tags
+
+    X, y = sk_datasets.make_regression(n_samples=100, n_features=4, random_state=42)
+    skl_estimator = compat.convert_river_to_sklearn(estimator.clone())
+
+    # Record the features the wrapped estimator learns from
+    learn_one = skl_estimator.instance_.learn_one
+    seen = []
+
+    def spy(x, *args):
+        seen.append(x)
+        return learn_one(x, *args)
+
+    skl_estimator.instance_.learn_one = spy
+    skl_estimator.partial_fit(X, y)
+    del skl_estimator.instance_.learn_one
+
+    assert len(seen) == len(X)
+    assert len({id(x) for x in seen}) == 1
+
+    for x, yi in zip(X, y):
+        if estimator._supervised:
+            estimator.learn_one(dict(enumerate(x)), yi)
+        else:
+            estimator.learn_one(dict(enumerate(x)))
+
+    x = dict(enumerate(X[0]))
+    if estimator._supervised:
+        assert skl_estimator.instance_.predict_one(x) == pytest.approx(estimator.predict_one(x))
+    else:
+        assert skl_estimator.instance_.transform_one(x) == pytest.approx(estimator.transform_one(x))
+
+
+def test_wrapper_of_read_only_input_doesnt_reuse_dict():
+    model = imblearn.HardSamplingRegressor(
+        linear_model.LinearRegression(), size=30, p=0.5, loss=optim.losses.Squared(), seed=1
+    )
+
+    # The wrapper keeps the features in its buffer, even though the wrapped model doesn't
+    assert base.tags.READ_ONLY_INPUT in model._wrapped_model._tags
+    assert base.tags.READ_ONLY_INPUT not in model._tags
+
+    X, y = sk_datasets.make_regression(n_samples=100, n_features=4, random_state=42)
+    skl_estimator = compat.convert_river_to_sklearn(model.clone()).fit(X, y)
+
+    buffer = skl_estimator.instance_.buffer
+    assert len({id(triplet.x) for triplet in buffer}) == len(buffer)
+
+    for x, yi in zip(X, y):
+        model.learn_one(dict(enumerate(x)), yi)
+
+    x = dict(enumerate(X[0]))
+    assert skl_estimator.instance_.predict_one(x) == pytest.approx(model.predict_one(x))
+
+
+def test_classifier_partial_fit_with_classes_list():
+    X, y = sk_datasets.make_classification(
+        n_samples=300, n_features=5, n_informative=3, n_classes=3, random_state=42
+    )
+    labels = ["a", "b", "a much longer label"]
+    y = [labels[yi] for yi in y]
+
+    skl_estimator = compat.convert_river_to_sklearn(tree.HoeffdingTreeClassifier())
+    skl_estimator.partial_fit(X, y, classes=labels)
+
+    model = tree.HoeffdingTreeClassifier()
+    for x, yi in zip(X, y):
+        model.learn_one(dict(enumerate(x)), yi)
+
+    y_pred = skl_estimator.predict(X)
+    assert y_pred.tolist() == [model.predict_one(dict(enumerate(x))) for x in X]
+
+
+def test_transformer_n_jobs_keeps_column_order():
+    X, _ = sk_datasets.make_regression(n_samples=3000, n_features=4, random_state=42)
+    skl_estimator = compat.convert_river_to_sklearn(preprocessing.StandardScaler()).fit(X)
+
+    X_trans = skl_estimator.transform(X)
+    assert skl_estimator.set_params(n_jobs=3).transform(X) == pytest.approx(X_trans)
+
+
+def test_transformer_different_output_features():
+    X, _ = sk_datasets.make_regression(n_samples=10, n_features=2, random_state=42)
+    skl_estimator = compat.convert_river_to_sklearn(
+        preprocessing.OneHotEncoder(drop_zeros=True)
+    ).fit(X)
+
+    with pytest.raises(ValueError, match="output features"):
+        skl_estimator.transform(X)
+
+
+def test_transformer_empty_output_features_for_first_row():
+    X, _ = sk_datasets.make_regression(n_samples=50, n_features=2, random_state=42)
+    X[0, 0] = -1000
+    skl_estimator = compat.convert_river_to_sklearn(
+        compose.FuncTransformer(lambda x: {} if x[0] < -100 else {"a": x[0]})
+    ).fit(X)
+
+    with pytest.raises(ValueError, match="output features"):
+        skl_estimator.transform(X)
+
+
+@pytest.mark.parametrize(
+    "estimator",
+    [
+        pytest.param(estimator, id=str(estimator))
+        for estimator in [
+            linear_model.LinearRegression(),
+            linear_model.LogisticRegression(),
+            linear_model.Perceptron(),
+        ]
+    ],
+)
+def test_linear_model_batch_predictions_match_predict_one(estimator):
+    X, y = sk_datasets.make_classification(n_samples=200, n_features=5, random_state=42)
+    skl_estimator = compat.convert_river_to_sklearn(estimator).fit(X, y)
+    model = skl_estimator.instance_
+    rows = [dict(enumerate(x)) for x in X]
+
+    if isinstance(model, base.Regressor):
+        assert skl_estimator.predict(X) == pytest.approx([model.predict_one(x) for x in rows])
+        return
+
+    assert skl_estimator.predict(X).tolist() == [int(model.predict_one(x)) for x in rows]
+    y_proba = [model.predict_proba_one(x) for x in rows]
+    assert skl_estimator.predict_proba(X) == pytest.approx([[p[False], p[True]] for p in y_proba])
+
+
+@pytest.mark.parametrize(
+    "estimator",
+    [
+        pytest.param(estimator, id=str(estimator))
+        for estimator in [tree.HoeffdingTreeRegressor(), tree.HoeffdingTreeClassifier()]
+    ],
+)
+def test_n_jobs_predictions_match_single_job(estimator):
+    X, y = sk_datasets.make_classification(n_samples=3000, n_features=5, random_state=42)
+    skl_estimator = compat.convert_river_to_sklearn(estimator).fit(X, y)
+
+    y_pred = skl_estimator.predict(X)
+    assert skl_estimator.set_params(n_jobs=3).predict(X).tolist() == y_pred.tolist()
+    if isinstance(estimator, base.Classifier):
+        y_proba = skl_estimator.set_params(n_jobs=1).predict_proba(X)
+        assert skl_estimator.set_params(n_jobs=3).predict_proba(X).tolist() == y_proba.tolist()
+
+
+def test_validate_false_skips_finiteness_check():
+    X, y = sk_datasets.make_regression(n_samples=100, n_features=4, random_state=42)
+    skl_estimator = compat.convert_river_to_sklearn(linear_model.LinearRegression()).fit(X, y)
+
+    X_nan = X.copy()
+    X_nan[0, 0] = float("nan")
+    with pytest.raises(ValueError):
+        skl_estimator.predict(X_nan)
+
+    y_pred = skl_estimator.set_params(validate=False).predict(X_nan)
+    assert len(y_pred) == len(X)
+    assert y_pred[1:] == pytest.approx(skl_estimator.predict(X[1:]))
+
+
+@pytest.mark.parametrize(
+    "X",
+    [
+        pytest.param(pd.DataFrame({"a": [1.5, 2.5, 3.5], "b": [4, 5, 6]}), id="numeric"),
+        pytest.param(pd.DataFrame({"a": [1.5, 2.5, 3.5], "b": ["x", "y", "z"]}), id="mixed"),
+    ],
+)
+@pytest.mark.parametrize("reuse", [False, True])
+def test_iter_pandas_matches_stream(X, reuse):
+    y = pd.Series([True, False, True])
+    iter_pandas = river_to_sklearn.STREAM_METHODS[pd.DataFrame]
+
+    rows = list(iter_pandas(X, y, reuse=reuse))
+    assert len({id(x) for x, _ in rows}) == (1 if reuse else len(X))
+
+    # The rows are copied as they are yielded, because a reused dictionary is updated in place
+    rows = [(dict(x), yi) for x, yi in iter_pandas(X, y, reuse=reuse)]
+    assert rows == list(stream.iter_pandas(X, y))
+
+
+def test_unpicklable_estimator_is_deep_copied():
+    estimator = compose.FuncTransformer(lambda x: {"double": 2 * x[0]})
+    with pytest.raises((pickle.PicklingError, AttributeError)):
+        pickle.dumps(estimator)
+
+    skl_estimator = compat.convert_river_to_sklearn(estimator)
+    assert skl_estimator.instance_ is not estimator
+
+    X, _ = sk_datasets.make_regression(n_samples=10, n_features=2, random_state=42)
+    X_trans = skl_estimator.fit(X).transform(X)
+    assert skl_estimator.instance_ is not estimator
+    assert X_trans[:, 0] == pytest.approx(2 * X[:, 0])
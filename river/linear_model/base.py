@@ -7,6 +7,7 @@ import numpy as np
 import pandas as pd
 
 from river import optim, utils
+from river.base import tags
 
 __all__ = ["GLM"]
 
@@ -99,6 +100,9 @@ class GLM:
         finally:
             self._weights = weights
 
+    def _more_tags(self):
+        return {tags.READ_ONLY_INPUT}
+
     def _get_intercept_update(self, loss_gradient):
         return self.intercept_lr.get(self.optimizer.n_iterations) * loss_gradient
 
@@ -9,11 +9,16 @@ from scipy import sparse
 
 from river.base import tags
 
-from . import base
+from . import base, complement_c
 
 __all__ = ["ComplementNB"]
 
 
+def _to_counter(index: dict, values: np.ndarray) -> collections.Counter:
+    """Maps the keys of an index to the values it points to."""
+    return collections.Counter(dict(zip(index, values[: len(index)].tolist())))
+
+
 class ComplementNB(base.BaseNB):
     """Naive Bayes classifier for multinomial models.
 
@@ -28,13 +33,19 @@ class ComplementNB(base.BaseNB):
 
     Attributes
     ----------
-    class_dist : proba.Multinomial
-        Class prior probability distribution.
+    class_counts : collections.Counter
+        Number of observations per class.
     feature_counts : collections.defaultdict
         Total frequencies per feature and class.
+    feature_totals : collections.Counter
+        Total frequencies per feature.
     class_totals : collections.Counter
         Total frequencies per class.
 
+    The counts are stored in numpy arrays indexed by feature and class. The attributes above are
+    built from these arrays each time they are accessed, so they are meant for inspection rather
+    than for use in a loop.
+
     Examples
     --------
 
@@ -115,14 +126,88 @@ class ComplementNB(base.BaseNB):
 
     def __init__(self, alpha=1.0):
         self.alpha = alpha
-        self.class_counts = collections.Counter()
-        self.feature_counts = collections.defaultdict(collections.Counter)
-        self.feature_totals = collections.Counter()
-        self.class_totals = collections.Counter()
+
+        # Features and classes are mapped to integer ids, which index the count arrays below. The
+        # arrays have some spare capacity, only the first len(index) entries are in use.
+        self._feature_index: dict = {}
+        self._class_index: dict = {}
+        self._fwc = np.zeros((0, 0))
+        self._feature_totals = np.zeros(0)
+        self._class_totals = np.zeros(0)
+        self._class_counts = np.zeros(0, dtype=int)
+        self._total_count = 0
+
+        # The log denominators and complement frequencies are cached between predictions, and
+        # invalidated as soon as the counts they depend on are updated
+        self._log_den: np.ndarray | None = None
+        self._log_cc: tuple[np.ndarray, sparse.csr_matrix] | None = None
 
     def _more_tags(self):
         return {tags.POSITIVE_INPUT}
 
+    @property
+    def class_counts(self) -> collections.Counter:
+        return _to_counter(self._class_index, self._class_counts)
+
+    @property
+    def feature_counts(self) -> collections.defaultdict:
+        classes = list(self._class_index)
+        counts: collections.defaultdict = collections.defaultdict(collections.Counter)
+        for f, row in zip(self._feature_index, self._counts().tolist()):
+            counts[f] = collections.Counter({c: n for c, n in zip(classes, row) if n})
+        return counts
+
+    @property
+    def feature_totals(self) -> collections.Counter:
+        return _to_counter(self._feature_index, self._feature_totals)
+
+    @property
+    def class_totals(self) -> collections.Counter:
+        return _to_counter(self._class_index, self._class_totals)
+
+    def _counts(self) -> np.ndarray:
+        """Frequency of each feature in each class, without the spare capacity."""
+        return self._fwc[: len(self._feature_index), : len(self._class_index)]
+
+    def _feature_id(self, f) -> int:
+        if (i := self._feature_index.get(f)) is None:
+            i = self._feature_index[f] = len(self._feature_index)
+            self._reserve()
+        return i
+
+    def _class_id(self, c) -> int:
+        if (j := self._class_index.get(c)) is None:
+            j = self._class_index[c] = len(self._class_index)
+            self._reserve()
+        return j
+
+    def _reserve(self):
+        """Grows the count arrays so that they fit every feature and class.
+
+        The capacity is doubled along each dimension that needs to grow, which amortizes the cost
+        of copying the counts.
+
+        """
+        rows, cols = self._fwc.shape
+        n_features, n_classes = len(self._feature_index), len(self._class_index)
+        if n_features <= rows and n_classes <= cols:
+            return
+
+        rows_, cols_ = rows, cols
+        if n_features > rows:
+            rows_ = max(n_features, 2 * rows)
+            self._feature_totals = np.concatenate((self._feature_totals, np.zeros(rows_ - rows)))
+        if n_classes > cols:
+            cols_ = max(n_classes, 2 * cols)
+            self._class_totals = np.concatenate((self._class_totals, np.zeros(cols_ - cols)))
+            self._class_counts = np.concatenate(
+                (self._class_counts, np.zeros(cols_ - cols, dtype=int))
+            )
+
+        fwc = np.zeros((rows_, cols_))
+        fwc[:rows, :cols] = self._fwc
+        self._fwc = fwc
+
     def learn_one(self, x, y):
         """Updates the model with a single observation.
 
@@ -134,19 +219,30 @@ class ComplementNB(base.BaseNB):
             Target class.
 
         """
-        self.class_counts.update((y,))
+        c = self._class_id(y)
+        self._class_counts[c] += 1
+        self._total_count += 1
 
+        total = 0
         for f, frequency in x.items():
-            self.feature_counts[f].update({y: frequency})
-            self.feature_totals.update({f: frequency})
-            self.class_totals.update({y: frequency})
+            i = self._feature_id(f)
+            self._fwc[i, c] += frequency
+            self._feature_totals[i] += frequency
+            total += frequency
+
+        self._class_totals[c] += total
+        self._log_den = None
+        self._log_cc = None
 
     def p_class(self, c):
-        return self.class_counts[c] / sum(self.class_counts.values())
+        if (j := self._class_index.get(c)) is None or not self._total_count:
+            return 0.0
+        return self._class_counts[j].item() / self._total_count
 
     def p_class_many(self) -> pd.DataFrame:
-        return base.from_dict(self.class_counts).T[self.class_counts] / sum(
-            self.class_counts.values()
+        class_counts = self._class_counts[: len(self._class_index)]
+        return pd.DataFrame(
+            [class_counts / self._total_count], columns=list(self._class_index), dtype="float32"
         )
 
     def joint_log_likelihood(self, x):
@@ -162,23 +258,46 @@ class ComplementNB(base.BaseNB):
         Mapping between classes and joint log likelihood.
 
         """
-        cc = {
-            c: {
-                f: self.feature_totals[f] + self.alpha - frequency.get(c, 0)
-                for f, frequency in self.feature_counts.items()
-            }
-            for c in self.class_counts
-        }
-
-        return {
-            c: sum(
-                {
-                    f: frequency * -math.log(cc[c].get(f, self.alpha) / sum(cc[c].values()))
-                    for f, frequency in x.items()
-                }.values()
-            )
-            for c in self.class_counts
-        }
+        if not x or not self._feature_index:
+            return {c: 0.0 for c in self._class_index}
+
+        feature_ids, frequencies, unknown = [], [], 0.0
+        for f, frequency in x.items():
+            if (i := self._feature_index.get(f)) is None:
+                unknown += frequency
+            else:
+                feature_ids.append(i)
+                frequencies.append(frequency)
+
+        log_den = self._log_denominators()
+        jll = complement_c.joint_log_likelihood(
+            self._counts(),
+            self._feature_totals,
+            log_den,
+            np.array(feature_ids, dtype=np.intp),
+            np.array(frequencies, dtype=float),
+            self.alpha,
+        )
+
+        # Features that are not part of the vocabulary have a complement frequency of alpha, their
+        # contribution is therefore the same for each one of them
+        if unknown:
+            jll += unknown * (log_den - math.log(self.alpha))
+
+        return dict(zip(self._class_index, jll.tolist()))
+
+    def _log_denominators(self) -> np.ndarray:
+        """Log of the smoothed total frequency of the complement of each class.
+
+        The complement of a class `c` sums `feature_totals[f] + alpha - feature_counts[f][c]` over
+        every feature `f`, which simplifies to a closed form of the class totals.
+
+        """
+        if self._log_den is None:
+            class_totals = self._class_totals[: len(self._class_index)]
+            total = class_totals.sum() + self.alpha * len(self._feature_index)
+            self._log_den = np.log(total - class_totals)
+        return self._log_den
 
     def learn_many(self, X: pd.DataFrame, y: pd.Series):
         """Learn from a batch of count vectors.
@@ -195,63 +314,66 @@ class ComplementNB(base.BaseNB):
         columns, classes = X.columns, y.columns
         y = sparse.csc_matrix(y.sparse.to_coo()).T
 
-        self.class_counts.update({c: count.item() for c, count in zip(classes, y.sum(axis=1))})
-
         if hasattr(X, "sparse"):
             X = sparse.csr_matrix(X.sparse.to_coo())
+        else:
+            X = X.to_numpy()
 
-        fc = y @ X
+        # Sum the frequencies of each class in a single product, only non-zero counts are stored
+        fc = sparse.csr_matrix(y @ X)
 
-        self.class_totals.update({c: count.item() for c, count in zip(classes, fc.sum(axis=1))})
+        # Only the features with a non-zero count are added to the vocabulary
+        class_ids = np.array([self._class_id(c) for c in classes], dtype=np.intp)
+        present = np.unique(fc.indices)
+        feature_ids = np.full(len(columns), -1, dtype=np.intp)
+        feature_ids[present] = [self._feature_id(f) for f in columns[present]]
 
-        self.feature_totals.update(
-            {c: count.item() for c, count in zip(columns, np.array(fc.sum(axis=0)).flatten())}
-        )
+        class_counts = np.asarray(y.sum(axis=1)).ravel().astype(int)
+        self._class_counts[class_ids] += class_counts
+        self._total_count += class_counts.sum().item()
+        self._class_totals[class_ids] += np.asarray(fc.sum(axis=1)).ravel()
+        self._feature_totals[feature_ids[present]] += np.asarray(fc.sum(axis=0)).ravel()[present]
 
-        # Update feature counts by slicing the sparse matrix per column.
-        # Each column correspond to a class.
-        for c, i in zip(classes, range(fc.shape[0])):
-            counts = {c: {columns[f]: count for f, count in zip(fc[i].indices, fc[i].data)}}
+        # Each (feature, class) pair appears once in the product, so the update can be scattered
+        rows = feature_ids[fc.indices]
+        cols = np.repeat(class_ids, np.diff(fc.indptr))
+        self._fwc[rows, cols] += fc.data
 
-            # Transform {classe_i: {token_1: f_1, ... token_n: f_n}} into:
-            # [{token_1: {classe_i: f_1}},.. {token_n: {class_i: f_n}}]
-            for dict_count in [
-                {token: {c: f} for token, f in frequencies.items()}
-                for c, frequencies in counts.items()
-            ]:
-                for f, count in dict_count.items():
-                    self.feature_counts[f].update(count)
+        self._log_den = None
+        self._log_cc = None
 
-    def _feature_log_prob(self, unknown: list, columns: list) -> pd.DataFrame:
-        """Compute log probabilities of input features.
+    def _log_complement(self) -> tuple[np.ndarray, sparse.csr_matrix]:
+        """Log of the smoothed frequency of each feature in the complement of each class.
 
-        Parameters
-        ----------
-        unknown
-            List of features that are not part the vocabulary.
-        columns
-            List of input features.
+        `log(feature_totals[f] + alpha - feature_counts[f][c])` is split into
+        `log(feature_totals[f] + alpha)`, which doesn't depend on the class, and
+        `log(1 - feature_counts[f][c] / (feature_totals[f] + alpha))`, which is zero unless the
+        feature has been seen with the class. The second term is thus stored as a sparse matrix,
+        with one row per feature and one column per class.
 
-        Returns
-        -------
-        Log probabilities of input features.
+        Both terms have an extra trailing row for features that are not part of the vocabulary,
+        which have a complement frequency of alpha. These features can thus be indexed with -1.
 
         """
-        cc = (
-            base.from_dict(self.feature_totals).squeeze().T
-            + self.alpha
-            - base.from_dict(self.feature_counts).fillna(0).T
-        )
-
-        sum_cc = cc.sum(axis=1).values
-
-        cc[unknown] = self.alpha
-
-        return -np.log(cc[columns].T / sum_cc)
+        if self._log_cc is None:
+            fwc = self._counts()
+            totals = np.append(self._feature_totals[: len(fwc)] + self.alpha, self.alpha)
+            rows, cols = np.nonzero(fwc)
+            ratios = np.log1p(-fwc[rows, cols] / totals[rows]).astype(np.float32)
+            self._log_cc = (
+                np.log(totals).astype(np.float32),
+                sparse.csr_matrix((ratios, (rows, cols)), shape=(len(fwc) + 1, fwc.shape[1])),
+            )
+        return self._log_cc
 
     def joint_log_likelihood_many(self, X: pd.DataFrame) -> pd.DataFrame:
         """Computes the joint log likelihood of input features.
 
+        The products are done in single precision, which trades accuracy for speed. The log
+        likelihoods can thus differ from those of `joint_log_likelihood` by up to around 1e-2 for
+        long documents, and the probabilities of `predict_proba_many` from those of
+        `predict_proba_one` by up to around 1e-4. The most likely class is usually the same.
+
         Parameters
         ----------
         X
@@ -263,16 +385,37 @@ class ComplementNB(base.BaseNB):
 
         """
         index, columns = X.index, X.columns
-        unknown = [x for x in columns if x not in self.feature_counts]
 
-        if not self.class_counts or not self.feature_counts:
+        if not self._class_index or not self._feature_index:
             return pd.DataFrame(index=index)
 
+        log_den = self._log_denominators()
+        log_totals, log_ratios = self._log_complement()
+
+        feature_ids = np.fromiter(
+            (self._feature_index.get(f, -1) for f in columns), dtype=int, count=len(columns)
+        )
+        log_cc = log_totals[feature_ids]
+        log_ratios = log_ratios[feature_ids]
+
+        # The products are done in single precision, which halves the memory traffic at the cost
+        # of some accuracy. Sparse inputs are multiplied with the sparse ratios, while
+        # dense inputs are better off with a dense product.
         if hasattr(X, "sparse"):
-            X = sparse.csr_matrix(X.sparse.to_coo())
+            X = sparse.csr_matrix(X.sparse.to_coo(), dtype=np.float32)
+        else:
+            X = X.to_numpy(dtype=np.float32)
+            log_ratios = log_ratios.toarray()
+
+        # Each feature contributes its frequency times log_den - log_cc - log_ratio, the last term
+        # is only nonzero for features that have been seen with a class
+        jll = np.outer(np.asarray(X.sum(axis=1)).ravel(), log_den)
+        jll -= (X @ log_cc)[:, None]
+        ratios = X @ log_ratios
+        jll -= ratios.toarray() if sparse.issparse(ratios) else ratios
 
         return pd.DataFrame(
-            X @ self._feature_log_prob(unknown=unknown, columns=columns),
+            jll,
             index=index,
-            columns=self.class_counts.keys(),
+            columns=list(self._class_index),
         )
@@ -0,0 +1,10 @@
+import numpy as np
+
+def joint_log_likelihood(
+    fwc: np.ndarray,
+    feature_totals: np.ndarray,
+    log_den: np.ndarray,
+    feature_ids: np.ndarray,
+    frequencies: np.ndarray,
+    alpha: float,
+) -> np.ndarray: ...
@@ -0,0 +1,59 @@
+# cython: boundscheck=False
+# cython: wraparound=False
+
+from libc.math cimport log
+
+import numpy as np
+
+
+def joint_log_likelihood(
+    const double[:, :] fwc,
+    const double[:] feature_totals,
+    const double[:] log_den,
+    const Py_ssize_t[:] feature_ids,
+    const double[:] frequencies,
+    double alpha,
+):
+    """Joint log likelihood of a single observation for Complement Naive Bayes.
+
+    Parameters
+    ----------
+    fwc
+        Frequency of each feature in each class, with one row per feature and one column per
+        class.
+    feature_totals
+        Total frequency of each feature.
+    log_den
+        Log of the smoothed total frequency of the complement of each class.
+    feature_ids
+        Rows of `fwc` that correspond to the features of the observation. Only features that are
+        part of the vocabulary can be scored here.
+    frequencies
+        Frequency of each feature of the observation.
+    alpha
+        Additive smoothing parameter.
+
+    Returns
+    -------
+    The joint log likelihood of each class.
+
+    """
+
+    cdef Py_ssize_t n_classes = fwc.shape[1]
+    cdef Py_ssize_t i, j, f
+    cdef double frequency, total
+
+    jll = np.zeros(n_classes)
+    cdef double[:] out = jll
+
+    for i in range(feature_ids.shape[0]):
+        f = feature_ids[i]
+        frequency = frequencies[i]
+        total = feature_totals[f] + alpha
+
+        # The frequency of a feature in the complement of a class is its total frequency minus
+        # its frequency in the class
+        for j in range(n_classes):
+            out[j] += frequency * (log_den[j] - log(total - fwc[f, j]))
+
+    return jll
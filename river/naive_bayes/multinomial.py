@@ -219,29 +219,34 @@ class MultinomialNB(base.BaseNB):
                 for f, count in dict_count.items():
                     self.feature_counts[f].update(count)
 
-    def _feature_log_prob(self, columns: list, known: list, unknown: list) -> pd.DataFrame:
+    def _feature_log_prob(self, columns: list, classes: list) -> np.ndarray:
         """Compute log probabilities of input features.
 
         Parameters
         ----------
         columns
             List of input features.
-        known
-            List of input features that are part of the vocabulary.
-        unknown
-            List of input features that are not part the vocabulary.
+        classes
+            List of classes, which gives the order of the output columns.
 
         Returns
         -------
-        Log probabilities of input features.
+        Log probabilities of input features, with one row per feature and one column per class.
 
         """
-        smooth_fc = np.log(base.from_dict(self.feature_counts).fillna(0).T[known] + self.alpha)
-        smooth_fc[unknown] = np.log(self.alpha)
+        class_index = {c: j for j, c in enumerate(classes)}
 
-        smooth_cc = np.log(base.from_dict(self.class_totals) + self.alpha * self.n_terms)
+        # Features that are not part of the vocabulary have a count of 0 for every class
+        smooth_fc = np.zeros((len(columns), len(classes)))
+        for i, f in enumerate(columns):
+            for c, count in self.feature_counts.get(f, {}).items():
+                smooth_fc[i, class_index[c]] = count
+        smooth_fc += self.alpha
+        np.log(smooth_fc, out=smooth_fc)
 
-        return smooth_fc.subtract(smooth_cc.values, axis="rows")[columns].T
+        smooth_cc = np.log([self.class_totals[c] + self.alpha * self.n_terms for c in classes])
+
+        return smooth_fc - smooth_cc
 
     def joint_log_likelihood_many(self, X: pd.DataFrame) -> pd.DataFrame:
         """Computes the joint log likelihood of input features.
@@ -257,23 +262,20 @@ class MultinomialNB(base.BaseNB):
 
         """
         index, columns = X.index, X.columns
-        known, unknown = [], []
 
         if not self.class_counts or not self.feature_counts:
             return pd.DataFrame(index=index)
 
-        for f in columns:
-            if f in self.feature_counts:
-                known.append(f)
-            else:
-                unknown.append(f)
-
         if hasattr(X, "sparse"):
             X = sparse.csr_matrix(X.sparse.to_coo())
+        else:
+            X = X.to_numpy()
+
+        classes = list(self.class_totals)
 
         return pd.DataFrame(
-            X @ self._feature_log_prob(columns=columns, known=known, unknown=unknown)
-            + np.log(self.p_class_many()).values,
+            X @ self._feature_log_prob(columns=columns, classes=classes)
+            + np.log([self.p_class(c) for c in classes]),
             index=index,
-            columns=self.class_totals.keys(),
+            columns=classes,
         )
@@ -166,6 +166,35 @@ def test_learn_many_vs_learn_one(model, batch_model):
         assert model["model"].feature_totals == batch_model["model"].feature_totals
 
 
+def test_complement_nb_dense_learn_many_vs_learn_one():
+    """Assert that ComplementNB learns the same from a dense dataframe in mini-batch mode as it
+    does in incremental mode.
+    """
+    X = pd.DataFrame(
+        [[2, 1, 0, 0, 0, 0], [2, 0, 1, 0, 0, 0], [1, 0, 0, 1, 0, 0], [1, 0, 0, 0, 1, 1]],
+        columns=["Chinese", "Beijing", "Shanghai", "Macao", "Tokyo", "Japan"],
+    )
+    y = pd.Series(["yes", "yes", "yes", "no"])
+
+    model = naive_bayes.ComplementNB()
+    for x, yi in zip(X.to_dict(orient="records"), y):
+        model.learn_one({f: n for f, n in x.items() if n}, yi)
+
+    batch_model = naive_bayes.ComplementNB()
+    batch_model.learn_many(X, y)
+
+    assert model.class_counts == batch_model.class_counts
+    assert model.feature_counts == batch_model.feature_counts
+    assert model.class_totals == batch_model.class_totals
+    assert model.feature_totals == batch_model.feature_totals
+
+    for x in X.to_dict(orient="records"):
+        x = {f: n for f, n in x.items() if n}
+        proba, batch_proba = model.predict_proba_one(x), batch_model.predict_proba_one(x)
+        assert proba["yes"] == pytest.approx(batch_proba["yes"])
+        assert proba["no"] == pytest.approx(batch_proba["no"])
+
+
 @pytest.mark.parametrize(
     "batch_model",
     [
@@ -238,3 +267,16 @@ def test_river_vs_sklearn(model, sk_model, bag):
     ):
         for sk_pred, river_pred in zip(sk_preds, river_preds):
             assert river_pred == pytest.approx(1 - sk_pred) or river_pred == pytest.approx(sk_pred)
+
+
+def test_multinomial_class_order():
+    """Ensure that MultinomialNB's batch predictions are aligned with the classes when the
+    features don't list the classes in the order in which they were first seen.
+    """
+    model = naive_bayes.MultinomialNB()
+    for x, y in [({"a": 1}, "yes"), ({"b": 2}, "no"), ({"a": 3}, "maybe")]:
+        model.learn_one(x, y)
+
+    X = pd.DataFrame([{"a": 1, "b": 0}, {"a": 0, "b": 1}, {"a": 2, "b": 1}])
+    for x, y_pred in zip(X.to_dict("records"), model.predict_proba_many(X).to_dict("records")):
+        assert y_pred == pytest.approx(model.predict_proba_one(x))
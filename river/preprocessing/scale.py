@@ -158,6 +158,9 @@ class StandardScaler(base.MiniBatchTransformer):
         self.means = collections.defaultdict(float)
         self.vars = collections.defaultdict(float)
 
+    def _more_tags(self):
+        return {base.tags.READ_ONLY_INPUT}
+
     def learn_one(self, x):
         for i, xi in x.items():
             self.counts[i] += 1